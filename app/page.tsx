@@ -7,25 +7,51 @@ import * as math from 'mathjs';
 
 // 简单的贝叶斯优化实现
 class SimpleBayesianOptimizer {
-  private observations: Array<{ params: number[]; value: number }> = [];
+  // 观测按行连续存放在预分配缓冲区中，容量不足时倍增
+  private paramBuffer = new Float64Array(0);
+  private valueBuffer = new Float64Array(0);
+  private count = 0;
+  private bestIndex = -1;
   private bounds: number[][];
   private maximize: boolean;
+  private discreteDims: number[];
+  private initialPoints: number[][];
 
-  constructor(bounds: number[][], maximize: boolean = false) {
+  constructor(bounds: number[][], maximize: boolean = false, discrete: boolean[] = [], initPoints: number = 3) {
     this.bounds = bounds;
     this.maximize = maximize;
+    // 只记录离散维度的下标，取整时跳过连续维度
+    this.discreteDims = discrete.flatMap((isDiscrete, d) => (isDiscrete ? [d] : []));
+    // 初始点一次性联合生成，保证整组满足拉丁超立方分层
+    this.initialPoints = this.latinHypercube(initPoints).map(point => this.snap(point));
   }
 
   addObservation(params: number[], value: number) {
-    this.observations.push({ params, value });
+    const dim = this.bounds.length;
+    if (this.count === this.valueBuffer.length) {
+      const capacity = Math.max(16, 2 * this.valueBuffer.length);
+      const paramBuffer = new Float64Array(capacity * dim);
+      paramBuffer.set(this.paramBuffer);
+      const valueBuffer = new Float64Array(capacity);
+      valueBuffer.set(this.valueBuffer);
+      this.paramBuffer = paramBuffer;
+      this.valueBuffer = valueBuffer;
+    }
+    this.paramBuffer.set(params, this.count * dim);
+    this.valueBuffer[this.count] = value;
+    // 增量维护当前最优观测，避免每次查询时遍历全部历史
+    if (this.bestIndex === -1 ||
+        (this.maximize && value > this.valueBuffer[this.bestIndex]) ||
+        (!this.maximize && value < this.valueBuffer[this.bestIndex])) {
+      this.bestIndex = this.count;
+    }
+    this.count++;
   }
 
   suggest(): number[] {
-    if (this.observations.length < 3) {
-      // 初始阶段：随机采样
-      return this.bounds.map(([min, max]) => 
-        min + Math.random() * (max - min)
-      );
+    if (this.count < this.initialPoints.length) {
+      // 初始阶段：依次取出预先生成的拉丁超立方样本
+      return this.initialPoints[this.count].slice();
     }
 
     // 简单实现：使用上置信界(UCB)算法
@@ -33,83 +59,124 @@ class SimpleBayesianOptimizer {
   }
 
   private acquisitionFunction(): number[] {
-    // 简单实现：在参数空间内随机采样，选择最佳acquisition值
+    // 先用拉丁超立方候选集整体打分，再只从得分最高的几个起点做局部细化
     const numCandidates = 100;
+    const numStarts = 3;
+    const numRefineSteps = 10;
+    // 候选评估期间不变的量只计算一次
+    const spans = this.bounds.map(([min, max]) => max - min);
+    const sign = this.maximize ? 1 : -1;
+
+    const scored = this.latinHypercube(numCandidates).map(candidate => {
+      const snapped = this.snap(candidate);
+      return { candidate: snapped, score: sign * this.calculateAcquisition(snapped) };
+    });
+    scored.sort((a, b) => b.score - a.score);
+
     let bestCandidate: number[] = [];
-    let bestAcquisition = this.maximize ? -Infinity : Infinity;
+    let bestScore = -Infinity;
+
+    for (const start of scored.slice(0, numStarts)) {
+      let current = start.candidate;
+      let currentScore = start.score;
+      let radius = 0.1;
+
+      // 局部细化：在当前点附近扰动，未改进时缩小步长
+      for (let step = 0; step < numRefineSteps; step++) {
+        const trial = this.snap(current.map((value, d) => {
+          const [min, max] = this.bounds[d];
+          const moved = value + (2 * Math.random() - 1) * radius * spans[d];
+          return Math.min(Math.max(moved, min), max);
+        }));
+        const trialScore = sign * this.calculateAcquisition(trial);
+
+        if (trialScore > currentScore) {
+          current = trial;
+          currentScore = trialScore;
+        } else {
+          radius *= 0.5;
+        }
+      }
 
-    for (let i = 0; i < numCandidates; i++) {
-      const candidate = this.bounds.map(([min, max]) => 
-        min + Math.random() * (max - min)
-      );
+      if (currentScore > bestScore) {
+        bestScore = currentScore;
+        bestCandidate = current;
+      }
+    }
 
-      const acquisition = this.calculateAcquisition(candidate);
+    return bestCandidate;
+  }
 
-      if ((this.maximize && acquisition > bestAcquisition) || 
-          (!this.maximize && acquisition < bestAcquisition)) {
-        bestAcquisition = acquisition;
-        bestCandidate = candidate;
+  private latinHypercube(n: number): number[][] {
+    // 拉丁超立方采样：每个维度分成 n 层，每层恰好落一个点
+    const samples: number[][] = Array.from({ length: n }, () => []);
+
+    for (const [min, max] of this.bounds) {
+      const strata = Array.from({ length: n }, (_, i) => i);
+      for (let i = n - 1; i > 0; i--) {
+        const j = Math.floor(Math.random() * (i + 1));
+        [strata[i], strata[j]] = [strata[j], strata[i]];
+      }
+      for (let i = 0; i < n; i++) {
+        samples[i].push(min + ((strata[i] + Math.random()) / n) * (max - min));
       }
     }
 
-    return bestCandidate;
+    return samples;
   }
 
-  private calculateAcquisition(params: number[]): number {
-    // 简单实现：使用均值 + 探索项
-    const mean = this.estimateMean(params);
-    const exploration = this.calculateExploration(params);
-    
-    return this.maximize ? mean + exploration : mean - exploration;
+  private snap(params: number[]): number[] {
+    // 整数/分类维度取整到边界内最近的整数，使评估点与实际试验点一致
+    for (const d of this.discreteDims) {
+      const [min, max] = this.bounds[d];
+      params[d] = Math.min(Math.max(Math.round(params[d]), Math.ceil(min)), Math.floor(max));
+    }
+    return params;
   }
 
-  private estimateMean(params: number[]): number {
-    // 简单实现：基于距离的加权平均
+  private calculateAcquisition(params: number[]): number {
+    // 简单实现：使用均值 + 探索项
+    // 每个观测点的距离只计算一次，同时用于加权均值和探索项
+    const dim = this.bounds.length;
     let totalWeight = 0;
     let weightedSum = 0;
+    let minDistance = Infinity;
 
-    for (const obs of this.observations) {
-      const distance = this.calculateDistance(params, obs.params);
+    for (let i = 0, offset = 0; i < this.count; i++, offset += dim) {
+      // 距离直接在缓冲区上逐行累加，不经过辅助函数
+      let sum = 0;
+      for (let d = 0; d < dim; d++) {
+        const diff = params[d] - this.paramBuffer[offset + d];
+        sum += diff * diff;
+      }
+      const distance = Math.sqrt(sum);
+      // 基于距离的加权平均
       const weight = 1 / (1 + distance);
-      weightedSum += weight * obs.value;
+      weightedSum += weight * this.valueBuffer[i];
       totalWeight += weight;
-    }
-
-    return totalWeight > 0 ? weightedSum / totalWeight : 0;
-  }
-
-  private calculateExploration(params: number[]): number {
-    // 探索项：与最近观测点的距离
-    let minDistance = Infinity;
-    
-    for (const obs of this.observations) {
-      const distance = this.calculateDistance(params, obs.params);
+      // 探索项：与最近观测点的距离
       if (distance < minDistance) {
         minDistance = distance;
       }
     }
 
-    return minDistance === Infinity ? 1 : minDistance;
-  }
+    const mean = totalWeight > 0 ? weightedSum / totalWeight : 0;
+    const exploration = minDistance === Infinity ? 1 : minDistance;
 
-  private calculateDistance(a: number[], b: number[]): number {
-    return Math.sqrt(a.reduce((sum, val, i) => sum + Math.pow(val - b[i], 2), 0));
+    return this.maximize ? mean + exploration : mean - exploration;
   }
 
   getBestResult(): { params: number[]; value: number } {
-    if (this.observations.length === 0) {
+    if (this.bestIndex === -1) {
       return { params: [], value: 0 };
     }
 
-    let bestIndex = 0;
-    for (let i = 1; i < this.observations.length; i++) {
-      if ((this.maximize && this.observations[i].value > this.observations[bestIndex].value) ||
-          (!this.maximize && this.observations[i].value < this.observations[bestIndex].value)) {
-        bestIndex = i;
-      }
-    }
-
-    return this.observations[bestIndex];
+    const bestIndex = this.bestIndex;
+    const dim = this.bounds.length;
+    return {
+      params: Array.from(this.paramBuffer.subarray(bestIndex * dim, (bestIndex + 1) * dim)),
+      value: this.valueBuffer[bestIndex]
+    };
   }
 }
 
@@ -310,6 +377,7 @@ export default function HomePage() {
     setError('');
     let localCategoryMaps: Record<string, string[]> = {};
     const bounds: number[][] = [];
+    const discrete: boolean[] = [];
 
     for (let param of parameters) {
       const name = param.name.trim();
@@ -331,6 +399,7 @@ export default function HomePage() {
         }
         bounds.push([parsedRange[0], parsedRange[1]]);
       }
+      discrete.push(param.type !== 'continuous');
     }
 
     setCategoryMaps(localCategoryMaps);
@@ -338,7 +407,7 @@ export default function HomePage() {
     try {
       setIsLoading(true);
       
-      const bayesOpt = new SimpleBayesianOptimizer(bounds, direction === 'maximize');
+      const bayesOpt = new SimpleBayesianOptimizer(bounds, direction === 'maximize', discrete);
       
       // 添加所有手动试验结果到优化器
       for (const trial of manualTrials) {
@@ -495,6 +564,7 @@ export default function HomePage() {
       
       // 重新创建优化器
       const bounds: number[][] = [];
+      const discrete: boolean[] = [];
       const localCategoryMaps: Record<string, string[]> = {};
       
       for (let param of savedConfig.parameters) {
@@ -509,11 +579,12 @@ export default function HomePage() {
           const parsedRange = param.range.trim().replace(/[\[\]]/g, '').split(/[-, ]+/).map(Number);
           bounds.push([parsedRange[0], parsedRange[1]]);
         }
+        discrete.push(param.type !== 'continuous');
       }
 
       setCategoryMaps(localCategoryMaps);
       
-      const bayesOpt = new SimpleBayesianOptimizer(bounds, savedConfig.direction === 'maximize');
+      const bayesOpt = new SimpleBayesianOptimizer(bounds, savedConfig.direction === 'maximize', discrete);
       
       // 添加所有历史观察
       history.forEach(item => {